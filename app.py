@@ -1,10 +1,11 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import gspread
+from gspread.utils import a1_to_rowcol, absolute_range_name, extract_id_from_url, rowcol_to_a1
 from gspread_dataframe import set_with_dataframe
 from oauth2client.service_account import ServiceAccountCredentials
 import random
-import time
 from datetime import datetime
 
 # Import configurations from config.py
@@ -27,6 +28,16 @@ SCOPE = [
     "https://www.googleapis.com/auth/drive"
 ]
 
+# Format used when writing evaluation dates, so they can be parsed back without guessing
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Every value an aspect column can hold, so answers can be compared as small integer codes
+ANSWER_CATEGORIES = list(dict.fromkeys(
+    [option for aspect in ASPECTOS_AVALIACAO for option in aspect["opcoes"]] + ["SKIPPED"]
+))
+ANSWER_CODES = {answer: code for code, answer in enumerate(ANSWER_CATEGORIES)}
+SKIPPED_CODE = ANSWER_CODES["SKIPPED"]
+
 @st.cache_resource
 def get_gspread_client():
     """Connects to Google Sheets using service account credentials."""
@@ -34,34 +45,147 @@ def get_gspread_client():
     client = gspread.authorize(creds)
     return client
 
-def get_sheet_as_df(client, sheet_url, sheet_name=None):
-    """Loads a specific sheet (or the first one) from a spreadsheet as a DataFrame."""
+@st.cache_resource
+def get_results_worksheet(_client):
+    """Opens the results worksheet once and reuses the handle for every save."""
+    return _client.open_by_url(RESULTS_SHEET_URL).get_worksheet(0)
+
+def values_to_df(values):
+    """Builds a DataFrame from a list of rows, using the first row as header."""
+    if not values:
+        return pd.DataFrame()
+    header = values[0]
+    width = len(header)
+    # The API omits trailing empty cells, so pad (or trim) every row to the header width
+    rows = [row[:width] + [""] * (width - len(row)) for row in values[1:]]
+    return pd.DataFrame.from_records(rows, columns=header)
+
+def to_cell_value(value):
+    """Converts a DataFrame value into a JSON-serializable cell value for the Sheets API."""
+    if pd.isna(value):
+        return ""
+    return value.item() if hasattr(value, "item") else value
+
+def appended_sheet_row(response):
+    """Returns the sheet row number that a values.append response actually wrote to."""
+    updated_range = response["updates"]["updatedRange"]
+    first_cell = updated_range.rsplit("!", 1)[-1].split(":")[0]
+    return a1_to_rowcol(first_cell)[0]
+
+def cache_results_header(df_results):
+    """Keeps the results header, its column number map and the reviewer column index in the session state."""
+    header = tuple(df_results.columns)
+    if st.session_state.get('results_header') != header:
+        st.session_state.results_header = header
+        st.session_state.results_header_cols = {col: i + 1 for i, col in enumerate(header)}
+        st.session_state.results_col_index = build_reviewer_col_index(header)
+
+def cache_title_rows(df_results):
+    """Keeps a Title -> row label map of a freshly loaded results frame in the session state."""
+    # Keep the first row of a duplicated title, like a df[df['Title'] == title].index[0] lookup
+    first_rows = df_results[~df_results['Title'].duplicated()]
+    st.session_state.title_row = dict(zip(first_rows['Title'], first_rows.index))
+
+def cache_answer_codes(df_results):
+    """Encodes every aspect column of a freshly loaded results frame as category codes (-1 for blank or unknown)."""
+    st.session_state.answer_codes = {
+        col: pd.Categorical(df_results[col], categories=ANSWER_CATEGORIES).codes.astype(np.int16)
+        for col in df_results.columns if "/Aspect " in col
+    }
+
+def update_answer_codes(n_rows, row_idx, cols, values):
+    """Writes saved answers into the cached codes, growing every column to the frame's current length."""
+    answer_codes = st.session_state.answer_codes
+    for col, col_codes in answer_codes.items():
+        if len(col_codes) < n_rows:
+            padding = np.full(n_rows - len(col_codes), -1, dtype=np.int16)
+            answer_codes[col] = np.concatenate([col_codes, padding])
+    for col, value in zip(cols, values):
+        if col not in answer_codes:
+            answer_codes[col] = np.full(n_rows, -1, dtype=np.int16)
+        answer_codes[col][row_idx] = ANSWER_CODES.get(value, -1)
+
+def load_results(client, modified_time):
+    """Returns the results DataFrame matching the given Drive 'modifiedTime' of the results sheet.
+
+    The copy kept in the session is reused only while the sheet's 'modifiedTime' is the one
+    recorded when this session last read or wrote it; otherwise the sheet is read again.
+    Returns None if the sheet could not be read, so nothing is cached or written from it.
+    """
+    cached = st.session_state.get('df_results_cache')
+    if cached is not None and modified_time is not None and modified_time == st.session_state.get('df_results_modified'):
+        return cached
+
+    if modified_time is None:
+        # Without a modification time the cache key cannot tell versions apart
+        get_sheet_as_df.clear()
     try:
-        sheet = client.open_by_url(sheet_url)
-        if sheet_name:
-            worksheet = sheet.worksheet(sheet_name)
-        else:
-            worksheet = sheet.get_worksheet(0)
-        data = worksheet.get_all_records()
-        return pd.DataFrame(data)
+        df_results = get_sheet_as_df(client, RESULTS_SHEET_URL, modified_time=modified_time)
     except Exception as e:
-        st.error(f"Error loading spreadsheet '{sheet_url}'. Check the URL and share permissions. Error: {e}")
-        return pd.DataFrame()
+        st.error(f"Error loading spreadsheet '{RESULTS_SHEET_URL}'. Check the URL and share permissions. Error: {e}")
+        return None
+    if df_results.empty:
+        df_results = pd.DataFrame(columns=["Title", "Abstract"])
+    cache_results_header(df_results)
+    cache_title_rows(df_results)
+    cache_answer_codes(df_results)
+
+    st.session_state.df_results_cache = df_results
+    st.session_state.df_results_modified = modified_time
+    st.session_state.results_version = st.session_state.get('results_version', 0) + 1
+    return df_results
 
-@st.cache_data
-def get_all_articles(_client, sheet_url):
-    """Loads and cleans articles from all sheets in a spreadsheet."""
+def get_sheet_modified_time(client, sheet_url):
+    """Returns the Drive 'modifiedTime' of a spreadsheet, used to detect stale cached data."""
+    try:
+        return client.get_file_drive_metadata(extract_id_from_url(sheet_url)).get("modifiedTime")
+    except Exception as e:
+        st.warning(f"Could not check whether spreadsheet '{sheet_url}' changed; cached data may be stale. Error: {e}")
+        return None
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_recent_modified_time(_client, sheet_url):
+    """Same as get_sheet_modified_time, but cached briefly so reruns do not hit the Drive API."""
+    return get_sheet_modified_time(_client, sheet_url)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_sheet_as_df(_client, sheet_url, sheet_name=None, modified_time=None):
+    """Loads a specific sheet (or the first one) from a spreadsheet as a DataFrame.
+
+    'modified_time' is only used as part of the cache key, so a changed sheet is read again.
+    Errors are raised rather than returned as an empty frame, so a failed read is never
+    cached or mistaken for an empty sheet.
+    """
+    sheet = _client.open_by_url(sheet_url)
+    if sheet_name:
+        worksheet = sheet.worksheet(sheet_name)
+    else:
+        worksheet = sheet.get_worksheet(0)
+    return values_to_df(worksheet.get_all_values())
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_all_articles(_client, sheet_url, modified_time=None):
+    """Loads and cleans articles from all sheets in a spreadsheet.
+
+    Returns the articles DataFrame and an Index of its titles, whose positions are the
+    article codes (and row labels) used for lookups and set math.
+    'modified_time' is only used as part of the cache key, so editing the
+    spreadsheet invalidates the cached articles before the TTL expires.
+    """
     try:
         spreadsheet = _client.open_by_url(sheet_url)
+        # Fetch every tab in a single values.batchGet round trip
+        ranges = [absolute_range_name(worksheet.title) for worksheet in spreadsheet.worksheets()]
+        response = spreadsheet.values_batch_get(ranges)
         all_dfs = []
-        for worksheet in spreadsheet.worksheets():
-            data = worksheet.get_all_records()
-            if data:
-                all_dfs.append(pd.DataFrame(data))
+        for value_range in response.get("valueRanges", []):
+            df = values_to_df(value_range.get("values", []))
+            if not df.empty:
+                all_dfs.append(df)
         
         if not all_dfs:
             st.warning("No data found in the source spreadsheet.")
-            return pd.DataFrame()
+            return pd.DataFrame(), pd.Index([])
 
         full_df = pd.concat(all_dfs, ignore_index=True)
 
@@ -71,59 +195,109 @@ def get_all_articles(_client, sheet_url):
                 full_df[col] = pd.to_numeric(full_df[col], errors='coerce').fillna(0).astype(int)
 
         must_exist = ['Title', 'Abstract'] + [col for col in COLUNAS_ORDENACAO_FALLBACK if col]
-        missing_cols = [col for col in must_exist if col not in full_df.columns]
+        missing_cols = list(pd.Index(must_exist).difference(full_df.columns))
 
         if missing_cols:
             st.error(f"The following required columns were not found in the source spreadsheet: {missing_cols}")
-            return pd.DataFrame()
+            return pd.DataFrame(), pd.Index([])
             
-        return full_df.drop_duplicates(subset=["Title"])
+        full_df = full_df[~full_df['Title'].duplicated()].reset_index(drop=True)
+        # Titles are unique now, so each row position doubles as the article's integer code
+        title_index = pd.Index(full_df['Title'])
+        return full_df, title_index
     except Exception as e:
         st.error(f"Error loading the source spreadsheet '{sheet_url}'. Error: {e}")
-        return pd.DataFrame()
-
-def select_next_article(reviewer_cpf, df_articles, df_results):
-    """Decides which article to show to the reviewer from the provided DataFrame."""
+        return pd.DataFrame(), pd.Index([])
+
+def build_reviewer_col_index(columns):
+    """Groups the '<cpf>/<field>' result columns by reviewer CPF in a single pass."""
+    col_index = {}
+    for col in columns:
+        cpf, sep, _ = col.partition("/")
+        if sep:
+            col_index.setdefault(cpf, []).append(col)
+    return col_index
+
+def answered_mask(df_results, cols):
+    """Returns a numpy boolean mask of the rows with at least one non-null value in 'cols'."""
+    return pd.notna(df_results[cols].to_numpy()).any(axis=1)
+
+def get_reviewed_titles(reviewer_cpf, df_results, col_index):
+    """Returns the reviewer's evaluated titles, scanning the results only once per login."""
+    reviewed_titles = st.session_state.setdefault('reviewed_titles', {})
+    if reviewer_cpf not in reviewed_titles:
+        reviewer_cols = col_index.get(reviewer_cpf, [])
+        mask = answered_mask(df_results, reviewer_cols)
+        reviewed_titles[reviewer_cpf] = set(df_results['Title'].to_numpy()[mask].tolist())
+    return reviewed_titles[reviewer_cpf]
+
+def select_next_article(reviewer_cpf, df_articles, df_results, col_index, title_index, reviewed_titles):
+    """Decides which article to show to the reviewer from the provided DataFrame.
+
+    Titles are handled as integer article codes (positions in 'title_index', which
+    are also the labels of 'df_articles'), so the set math runs on int arrays.
+    """
     if df_articles.empty:
         return None
 
-    reviewer_cols = [col for col in df_results.columns if col.startswith(f"{reviewer_cpf}/")]
-    if not reviewer_cols:
-        reviewed_by_user = set()
-    else:
-        reviewed_by_user = set(df_results[df_results[reviewer_cols].notna().any(axis=1)]['Title'])
+    available_codes = df_articles.index.to_numpy()
+    # Article code of every results row, -1 for titles no longer in the source
+    results_codes = title_index.get_indexer(df_results['Title'])
 
-    other_reviewers_cpfs = list(AVALIADORES.keys())
-    other_reviewers_cpfs.remove(reviewer_cpf)
-    
-    other_cols = []
-    for cpf in other_reviewers_cpfs:
-        other_cols.extend([col for col in df_results.columns if col.startswith(f"{cpf}/")])
+    reviewed_by_user = title_index.get_indexer(list(reviewed_titles))
+
+    # One pass over the reviewers that actually have columns in the results
+    other_cols = [
+        col
+        for cpf, cols in col_index.items() if cpf != reviewer_cpf and cpf in AVALIADORES
+        for col in cols
+    ]
 
     if other_cols:
-        reviewed_by_others = set(df_results[df_results[other_cols].notna().any(axis=1)]['Title'])
-        priority_to_review = list(reviewed_by_others - reviewed_by_user)
+        reviewed_by_others = results_codes[answered_mask(df_results, other_cols)]
         # Ensure priority articles are also within the filtered list
-        priority_to_review = [title for title in priority_to_review if title in df_articles['Title'].values]
-        if priority_to_review:
-            selected_title = random.choice(priority_to_review)
-            return df_articles[df_articles['Title'] == selected_title].iloc[0]
-
-    titles_in_results = set(df_results['Title'])
-    new_titles = set(df_articles['Title']) - titles_in_results - reviewed_by_user
+        if reviewed_by_user.size:
+            reviewed_by_others = np.setdiff1d(reviewed_by_others, reviewed_by_user)
+        priority_to_review = np.intersect1d(reviewed_by_others, available_codes)
+        if priority_to_review.size:
+            selected_code = random.choice(priority_to_review.tolist())
+            return df_articles.loc[selected_code]
+
+    # Titles reviewed by the user are always in the results, so one difference suffices.
+    # setdiff1d returns sorted codes, which keeps the source order for ties in the fallback sort.
+    new_codes = np.setdiff1d(available_codes, results_codes)
     
-    if not new_titles:
+    if not new_codes.size:
         return None
 
-    df_new = df_articles[df_articles['Title'].isin(list(new_titles))]
+    df_new = df_articles.loc[new_codes]
+
+    # Only the first row of the fallback order is needed, so narrow the candidates key by key
+    # (O(N) per key) instead of sorting them all; ties keep the source order, like a stable sort.
+    for col, ascending in zip(COLUNAS_ORDENACAO_FALLBACK, ORDENS_ORDENACAO_FALLBACK):
+        values = df_new[col]
+        best = values.min() if ascending else values.max()
+        df_new = df_new[(values == best).to_numpy()]
     
-    df_sorted = df_new.sort_values(
-        by=COLUNAS_ORDENACAO_FALLBACK,
-        ascending=ORDENS_ORDENACAO_FALLBACK
+    return df_new.iloc[0]
+
+def get_next_article(reviewer_cpf, df_articles, df_results, col_index, title_index, reviewed_titles,
+                     year_range, citation_range, articles_modified):
+    """Returns the next article, reusing the previous pick while the selection inputs are unchanged.
+
+    Saves drop the memo key themselves, so the key only has to notice reloads of the
+    results (through the load counter) and of the source articles.
+    """
+    key = (
+        reviewer_cpf, year_range, citation_range,
+        st.session_state.get('results_version'), articles_modified
     )
-    
-    return df_sorted.iloc[0]
-
+    if st.session_state.get('next_article_key') != key:
+        st.session_state.next_article = select_next_article(
+            reviewer_cpf, df_articles, df_results, col_index, title_index, reviewed_titles
+        )
+        st.session_state.next_article_key = key
+    return st.session_state.next_article
 
 def main():
     st.title("Scientific Article Evaluation Platform")
@@ -151,28 +325,40 @@ def main():
     if st.sidebar.button("Logout"):
         del st.session_state.user_cpf
         del st.session_state.user_name
+        st.session_state.pop('reviewed_titles', None)
         st.session_state.editing_title = None
         st.rerun()
+    if st.sidebar.button("Refresh Data"):
+        st.session_state.pop('df_results_cache', None)
+        st.session_state.pop('reviewed_titles', None)
+        get_sheet_as_df.clear()
+        get_recent_modified_time.clear()
+        st.rerun()
 
     client = get_gspread_client()
-    df_articles = get_all_articles(client, SOURCE_SHEET_URL)
-    df_results = get_sheet_as_df(client, RESULTS_SHEET_URL)
+    articles_modified = get_recent_modified_time(client, SOURCE_SHEET_URL)
+    df_articles, title_index = get_all_articles(client, SOURCE_SHEET_URL, articles_modified)
+    df_results = load_results(client, get_recent_modified_time(client, RESULTS_SHEET_URL))
 
     if df_articles.empty:
         st.warning("Could not load articles. Please check the configuration.")
         st.stop()
-        
-    if df_results.empty:
-        df_results = pd.DataFrame(columns=["Title", "Abstract"])
+
+    if df_results is None:
+        st.warning("Could not load the evaluation results. Please try again in a moment.")
+        st.stop()
 
     # --- CALCULATE USER STATS ---
-    reviewer_cols = [col for col in df_results.columns if col.startswith(f"{reviewer_cpf}/")]
-    df_user_evaluations = pd.DataFrame()
-    if reviewer_cols:
-        df_user_evaluations = df_results[df_results[reviewer_cols].notna().any(axis=1)].copy()
+    col_index = st.session_state.results_col_index
+    reviewer_cols = col_index.get(reviewer_cpf, [])
+    reviewed_by_user_set = get_reviewed_titles(reviewer_cpf, df_results, col_index)
+    title_row = st.session_state.title_row
+    # Sorted labels keep the rows in sheet order
+    df_user_evaluations = df_results.loc[
+        sorted(title_row[title] for title in reviewed_by_user_set if title in title_row)
+    ]
     
     total_reviewed_count = len(df_user_evaluations)
-    reviewed_by_user_set = set(df_user_evaluations['Title']) if not df_user_evaluations.empty else set()
 
     # --- SIDEBAR: FILTERS AND STATS ---
     st.sidebar.markdown("---")
@@ -197,12 +383,15 @@ def main():
         max_value=max_cites,
         value=(min_cites, max_cites)
     )
-    df_articles_filtered = df_articles[
-        (df_articles['Year'] >= year_range[0]) &
-        (df_articles['Year'] <= year_range[1]) &
-        (df_articles['Citations'] >= citation_range[0]) &
-        (df_articles['Citations'] <= citation_range[1])
-    ]
+    years = df_articles['Year'].to_numpy()
+    cites = df_articles['Citations'].to_numpy()
+    filter_mask = (
+        (years >= year_range[0]) &
+        (years <= year_range[1]) &
+        (cites >= citation_range[0]) &
+        (cites <= citation_range[1])
+    )
+    df_articles_filtered = df_articles.iloc[np.flatnonzero(filter_mask)]
     
     remaining_titles = set(df_articles_filtered['Title']) - reviewed_by_user_set
     remaining_count = len(remaining_titles)
@@ -218,9 +407,13 @@ def main():
 
         df_display = df_user_evaluations
         if show_skipped_only:
-            reviewer_aspect_cols = [col for col in reviewer_cols if "Aspect" in col]
+            reviewer_aspect_cols = [col for col in reviewer_cols if "/Aspect " in col]
             if reviewer_aspect_cols:
-                skipped_mask = df_display[reviewer_aspect_cols].eq("SKIPPED").any(axis=1)
+                # Row labels are positions in df_results, so they index the cached codes directly
+                answer_codes = st.session_state.answer_codes
+                rows = df_display.index.to_numpy()
+                codes = np.column_stack([answer_codes[col][rows] for col in reviewer_aspect_cols])
+                skipped_mask = (codes == SKIPPED_CODE).any(axis=1)
                 df_display = df_display[skipped_mask]
             else:
                 df_display = pd.DataFrame()
@@ -230,7 +423,7 @@ def main():
         selectbox_label = "Filtered Articles:"
         
         if reviewer_date_col in df_display.columns:
-            date_series = pd.to_datetime(df_display[reviewer_date_col], errors='coerce')
+            date_series = pd.to_datetime(df_display[reviewer_date_col], format=DATE_FORMAT, errors='coerce', cache=True)
             valid_dates = date_series.dropna()
             unique_days = sorted(valid_dates.dt.date.unique(), reverse=True)
 
@@ -275,17 +468,20 @@ def main():
             st.rerun()
         
         title_in_edit = st.session_state.editing_title
-        article_to_evaluate = df_articles[df_articles['Title'] == title_in_edit].iloc[0]
+        article_to_evaluate = df_articles.loc[title_index.get_loc(title_in_edit)]
         
         old_answers = {}
-        results_row_idx = df_results[df_results['Title'] == title_in_edit].index[0]
+        results_row_idx = st.session_state.title_row[title_in_edit]
         
         for i, aspect in enumerate(ASPECTOS_AVALIACAO):
             col_name = f"{reviewer_cpf}/Aspect {i+1}"
             if col_name in df_results.columns:
                 old_answers[f"aspect_{i+1}"] = df_results.loc[results_row_idx, col_name]
     else:
-        article_to_evaluate = select_next_article(reviewer_cpf, df_articles_filtered, df_results)
+        article_to_evaluate = get_next_article(
+            reviewer_cpf, df_articles_filtered, df_results, col_index, title_index, reviewed_by_user_set,
+            year_range, citation_range, articles_modified
+        )
 
     if article_to_evaluate is None and not st.session_state.editing_title:
         st.info("No articles match your current filter criteria, or all available articles have been reviewed.")
@@ -337,33 +533,90 @@ def main():
     if submitted or skipped:
         current_title = article_to_evaluate['Title']
         current_abstract = article_to_evaluate['Abstract']
-        
-        if current_title not in df_results['Title'].values:
-            new_row = pd.DataFrame([{"Title": current_title, "Abstract": current_abstract}])
-            df_results = pd.concat([df_results, new_row], ignore_index=True)
 
-        row_idx = df_results[df_results['Title'] == current_title].index[0]
+        # Writes address sheet rows by position, so start from a frame that matches the sheet right now
+        df_results = load_results(client, get_sheet_modified_time(client, RESULTS_SHEET_URL))
+        if df_results is None:
+            st.error("Your evaluation was not saved because the results spreadsheet could not be read.")
+            st.stop()
+        
+        title_row = st.session_state.title_row
+        is_new_title = current_title not in title_row
+        if is_new_title:
+            row_idx = len(df_results)
+            df_results.loc[row_idx, ["Title", "Abstract"]] = [current_title, current_abstract]
+            title_row[current_title] = row_idx
+        else:
+            row_idx = title_row[current_title]
 
         date_col = f"{reviewer_cpf}/EvaluationDate"
-        if date_col not in df_results.columns or pd.isna(df_results.loc[row_idx, date_col]):
-            df_results.loc[row_idx, date_col] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        aspect_cols = [f"{reviewer_cpf}/Aspect {i+1}" for i in range(len(ASPECTOS_AVALIACAO))]
+        missing_cols = [col for col in [date_col] + aspect_cols if col not in df_results.columns]
+        if missing_cols:
+            # Create all new reviewer columns at once instead of letting .loc add them one by one
+            df_results[missing_cols] = pd.NA
 
-        for i, aspect in enumerate(ASPECTOS_AVALIACAO):
-            col_name = f"{reviewer_cpf}/Aspect {i+1}"
-            value = responses[f"aspect_{i+1}"] if submitted else "SKIPPED"
-            df_results.loc[row_idx, col_name] = value
+        aspect_vals = [responses[f"aspect_{i+1}"] if submitted else "SKIPPED" for i in range(len(aspect_cols))]
+        updated_cols = list(aspect_cols)
+        updated_vals = list(aspect_vals)
+        if pd.isna(df_results.loc[row_idx, date_col]):
+            updated_cols.insert(0, date_col)
+            updated_vals.insert(0, datetime.now().strftime(DATE_FORMAT))
+        df_results.loc[row_idx, updated_cols] = updated_vals
 
         try:
-            results_worksheet = client.open_by_url(RESULTS_SHEET_URL).get_worksheet(0)
-            set_with_dataframe(results_worksheet, df_results, include_index=False)
+            results_worksheet = get_results_worksheet(client)
+            header_cols = st.session_state.results_header_cols
+            row_in_place = True
+            if tuple(df_results.columns) != st.session_state.results_header:
+                # A new reviewer column was created, so the header row must be rewritten
+                set_with_dataframe(results_worksheet, df_results, include_index=False)
+            elif is_new_title:
+                new_row = [to_cell_value(df_results.loc[row_idx, col]) for col in st.session_state.results_header]
+                response = results_worksheet.append_rows(
+                    [new_row],
+                    value_input_option="USER_ENTERED",
+                    insert_data_option="INSERT_ROWS"
+                )
+                # The row goes after the table the API detects, which is not always row_idx + 2
+                row_in_place = appended_sheet_row(response) == row_idx + 2
+            else:
+                # Row 1 holds the header, so DataFrame row 0 lives in sheet row 2
+                results_worksheet.batch_update(
+                    [
+                        {
+                            "range": rowcol_to_a1(row_idx + 2, header_cols[col]),
+                            "values": [[to_cell_value(df_results.loc[row_idx, col])]]
+                        }
+                        for col in updated_cols
+                    ],
+                    value_input_option="USER_ENTERED"
+                )
+            # Keep the saved frame, tagged with the sheet version it now matches, so the
+            # rerun does not fetch the whole results sheet again
+            cache_results_header(df_results)
+            update_answer_codes(len(df_results), row_idx, aspect_cols, aspect_vals)
+            st.session_state.df_results_cache = df_results
+            get_recent_modified_time.clear()
+            st.session_state.df_results_modified = get_sheet_modified_time(client, RESULTS_SHEET_URL)
+            if not row_in_place:
+                # The frame's row positions no longer match the sheet, so reload it on the next run
+                st.session_state.pop('df_results_cache', None)
+                st.session_state.pop('df_results_modified', None)
+            st.session_state.reviewed_titles[reviewer_cpf].add(current_title)
+            # The saved article must not be served again from the memoized pick
+            st.session_state.pop('next_article_key', None)
             
             success_msg = "Your evaluation was successfully updated!" if st.session_state.editing_title else "Your evaluation was successfully saved!"
-            st.success(success_msg)
+            st.toast(success_msg, icon="✅")
             st.session_state.editing_title = None
-            time.sleep(1.5)
             st.rerun()
 
         except Exception as e:
+            # The in-memory frame may no longer match the sheet, so reload it on the next run
+            st.session_state.pop('df_results_cache', None)
+            st.session_state.pop('df_results_modified', None)
+            st.session_state.pop('reviewed_titles', None)
             st.error(f"An error occurred while saving to the spreadsheet: {e}")
 
 if __name__ == "__main__":